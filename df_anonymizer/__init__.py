@@ -5,5 +5,6 @@ from .suppression import attributeSuppression, recordSuppression
 from .generalization import dateGeneralization, meanGeneralization, dataBucketing
 from .pseudonymization import randomword, generatePseudonym, pseudonymization
 from .evaluation import calculateKAnonymity
+from .pipeline import applyPipeline
 
-__all__ = ["maskID", "maskEmail", "agePerturbation", "weightPerturbation", "heightPerturbation", "dataPerturbation", "datePerturbation", "dataShuffling", "attributeSuppression", "recordSuppression", "dateGeneralization", "meanGeneralization", "dataBucketing", "randomword", "generatePseudonym", "pseudonymization", "calculateKAnonymity"]
\ No newline at end of file
+__all__ = ["maskID", "maskEmail", "agePerturbation", "weightPerturbation", "heightPerturbation", "dataPerturbation", "datePerturbation", "dataShuffling", "attributeSuppression", "recordSuppression", "dateGeneralization", "meanGeneralization", "dataBucketing", "randomword", "generatePseudonym", "pseudonymization", "calculateKAnonymity", "applyPipeline"]
\ No newline at end of file
@@ -0,0 +1,8 @@
+import pandas as pd
+
+# copy of the input frame that the transforms write their result column onto.
+# without copy-on-write a shallow copy would share the untouched columns' buffers
+# with the caller's frame (edits to the result would write through to the source),
+# so a deep copy is made; with copy-on-write enabled the shallow copy is safe.
+def _copy_frame(df):
+    return df.copy(deep=pd.options.mode.copy_on_write is not True)
@@ -0,0 +1,26 @@
+import pandas as pd
+import numpy as np
+
+# column-level type checks shared by the anonymization functions
+def _require_numeric(srs, message="Input must be a numerical data."):
+    if not pd.api.types.is_numeric_dtype(srs):
+        raise TypeError(message)
+
+def _require_datetime(srs, message="Input must be in datetime format."):
+    if not pd.api.types.is_datetime64_any_dtype(srs):
+        raise TypeError(message)
+
+# element types accepted in object columns mixing strings and integers
+_STRING_INTEGER_TYPES = [str, int, np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64]
+
+def _require_string(srs, allow_integer=False, message="Input must be a string."):
+    if isinstance(srs.dtype, pd.CategoricalDtype):
+        srs = pd.Series(srs.cat.categories)
+    inferred = pd.api.types.infer_dtype(srs, skipna=True)
+    if inferred in ("string", "empty"):
+        return
+    if allow_integer and inferred == "integer":
+        return
+    if allow_integer and inferred == "mixed-integer" and srs.dropna().map(type).isin(_STRING_INTEGER_TYPES).all():
+        return
+    raise TypeError(message)
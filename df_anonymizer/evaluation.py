@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-from collections import Counter
 
 # calculate the K-anonymity score
 def calculateKAnonymity(df, quasi_identifier):
@@ -32,12 +31,11 @@ def calculateKAnonymity(df, quasi_identifier):
     1
     """
 
-    if not all(item in df.columns for item in quasi_identifier):
-        wrgCol = list(set(quasi_identifier) - set(df.columns))
+    columns = set(df.columns)
+    wrgCol = [item for item in quasi_identifier if item not in columns]
+    if wrgCol:
         raise ValueError(f"Quasi identifier {wrgCol} not found in collumn name of dataframe.")
 
-    quasi_df = df[quasi_identifier]
-    tuple_rows = [tuple(row) for row in quasi_df.values]
-    combination_counts = Counter(tuple_rows)
-    k_anonymity = min(combination_counts.values())
+    group_sizes = df.groupby(list(quasi_identifier), dropna=False, sort=False, observed=True).size()
+    k_anonymity = int(group_sizes.min())
     return k_anonymity
\ No newline at end of file
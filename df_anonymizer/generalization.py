@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from ._validate import _require_numeric, _require_datetime
+from ._frame import _copy_frame
 
 # date generalization
 def dateGeneralization(df, attr, verbose=True):
@@ -8,7 +10,7 @@ def dateGeneralization(df, attr, verbose=True):
     Generalize a datetime column in a DataFrame by reducing its granularity.
 
     This function anonymizes temporal information by converting a datetime column
-    to either a year-month ("YYYY-MM") or year-only ("YYYY") format. This helps reduce 
+    to either monthly ("YYYY-MM") or yearly ("YYYY") periods. This helps reduce 
     identifiability while retaining useful date-related patterns.
 
     :param df: The input DataFrame containing the datetime column.
@@ -17,7 +19,7 @@ def dateGeneralization(df, attr, verbose=True):
     :type attr: str
     :param verbose: If True, generalize to "YYYY-MM"; if False, generalize to "YYYY".
     :type verbose: bool, optional
-    :return: A copy of the DataFrame with the specified column generalized.
+    :return: A copy of the DataFrame with the specified column generalized to a period dtype.
     :rtype: pandas.DataFrame
     :raises TypeError: If the specified column is not of datetime type.
 
@@ -36,13 +38,12 @@ def dateGeneralization(df, attr, verbose=True):
     1       2022
     """
 
-    if not pd.api.types.is_datetime64_any_dtype(df[attr]):
-        raise TypeError("Input must be in datetime format")
-    df_copy = df.copy()
+    _require_datetime(df[attr], message="Input must be in datetime format")
+    df_copy = _copy_frame(df)
     if verbose:
-        df_copy[attr] = df_copy[attr].dt.strftime("%Y-%m")
+        df_copy[attr] = df[attr].dt.to_period("M")
     else:
-        df_copy[attr] = df_copy[attr].dt.strftime("%Y")
+        df_copy[attr] = df[attr].dt.to_period("Y")
     return df_copy
 
 
@@ -55,6 +56,7 @@ def meanGeneralization(df, attr, bins):
     This function performs data generalization on continuous numeric data by dividing the values
     into a specified number of bins (intervals) and replacing each value with the midpoint
     of its corresponding bin. This helps to reduce data precision while preserving general trends.
+    Missing values (and values outside the given bin edges) are left as NaN.
 
     :param df: The input DataFrame containing the numerical attribute.
     :type df: pandas.DataFrame
@@ -64,7 +66,7 @@ def meanGeneralization(df, attr, bins):
     :type bins: int
     :return: A DataFrame with the specified column generalized to bin midpoints.
     :rtype: pandas.DataFrame
-    :raises TypeError: If the column contains non-numeric values.
+    :raises TypeError: If the column is not of a numeric dtype.
 
     :example:
 
@@ -79,16 +81,15 @@ def meanGeneralization(df, attr, bins):
     4   48
     """
 
-    for val in df[attr]:
-        if not isinstance(val, (int, float, np.int8, np.int16, np.int32, np.int64, np.float32, np.float64)):
-            raise TypeError("Input must be a numerical data.")
-    cont = []
-    val_binned, bins = pd.cut(df[attr], bins=bins, retbins=True)
-    for i in val_binned:
-        val_mean = (i.left + i.right) // 2
-        cont.append(val_mean)
-    df[attr] = cont
-    return df
+    _require_numeric(df[attr])
+    bin_codes, bin_edges = pd.cut(df[attr], bins=bins, labels=False, retbins=True)
+    bin_means = (bin_edges[:-1] + bin_edges[1:]) // 2
+    binned = bin_codes.notna().to_numpy()
+    val_means = np.empty(len(bin_codes), dtype=bin_means.dtype) if binned.all() else np.full(len(bin_codes), np.nan)
+    val_means[binned] = bin_means[bin_codes[binned].astype(int).to_numpy()]
+    df_copy = _copy_frame(df)
+    df_copy[attr] = val_means
+    return df_copy
 
 # data binning/bucketing
 def dataBucketing(df, attr, bins, labels):
@@ -110,7 +111,8 @@ def dataBucketing(df, attr, bins, labels):
     :type labels: list of str
     :return: A DataFrame with the specified column converted into bucket labels.
     :rtype: pandas.DataFrame
-    :raises TypeError: If the column contains non-numeric values.
+    :raises TypeError: If the column is not of a numeric dtype.
+    :raises ValueError: If the bin edges are not increasing or do not match the number of labels.
 
     :example:
 
@@ -127,10 +129,18 @@ def dataBucketing(df, attr, bins, labels):
     4  40-50s
     """
 
-    for val in df[attr]:
-        if not isinstance(val, (int, float, np.int8, np.int16, np.int32, np.int64, np.float32, np.float64)):
-            raise TypeError("Input must be a numerical data.")
-    cont = []
-    val_binned, bins = pd.cut(df[attr], bins=bins, labels=labels, ordered=True, retbins=True)
-    df[attr] = val_binned
-    return df
\ No newline at end of file
+    _require_numeric(df[attr])
+    values = df[attr]
+    bin_edges = np.asarray(bins)
+    if (bin_edges.ndim == 1 and bin_edges.dtype.kind in "iuf" and np.all(np.diff(bin_edges) > 0)
+            and pd.api.types.is_list_like(labels) and len(labels) == len(bin_edges) - 1 and pd.Index(labels).is_unique
+            and isinstance(values.dtype, np.dtype) and values.dtype.kind in "iuf"):
+        # plain numeric edges with one label per bin: look up the codes without building Intervals
+        bin_codes = np.digitize(values.to_numpy(), bin_edges, right=True) - 1
+        bin_codes[(bin_codes < 0) | (bin_codes >= len(labels))] = -1
+        val_binned = pd.Categorical.from_codes(bin_codes, categories=labels, ordered=True)
+    else:
+        val_binned = pd.cut(values, bins=bins, labels=labels, ordered=True)
+    df_copy = _copy_frame(df)
+    df_copy[attr] = val_binned
+    return df_copy
\ No newline at end of file
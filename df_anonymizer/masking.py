@@ -1,5 +1,13 @@
 import pandas as pd
 import numpy as np
+from ._validate import _require_string
+from ._frame import _copy_frame
+
+# asterisk runs of the given lengths, looked up from a table built once per call
+def _stars(srs, keep):
+    star_lens = (srs.str.len().fillna(0).to_numpy(dtype="int64") - keep).clip(min=0)
+    star_table = np.array(["*" * n for n in range(star_lens.max(initial=0) + 1)], dtype=object)
+    return pd.Series(star_table[star_lens], index=srs.index, dtype="string")
 
 # masking the ID and keep the last 3 digits
 def maskID(df, attr):
@@ -30,17 +38,13 @@ def maskID(df, attr):
     3  ******789
     """
 
-    cont = []
-    for id in df[attr]:
-        if id is None:
-            cont.append(id)
-        elif not isinstance(id, (int, str, np.int8, np.int16, np.int32, np.int64)):
-            raise TypeError("Input must ne a string or integer number.")
-        else:
-            id_str = str(id)
-            cont.append((len(list(id_str)[0:-3]) * "*") + ''.join(list(id_str)[-3:]))
-    df[attr] = cont
-    return df
+    ids = df[attr]
+    _require_string(ids, allow_integer=True, message="Input must ne a string or integer number.")
+    ids = ids.astype("string")
+    masked = _stars(ids, 3) + ids.str[-3:]
+    df_copy = _copy_frame(df)
+    df_copy[attr] = masked.astype(object).where(masked.notna(), None)
+    return df_copy
 
 # masking the email
 def maskEmail(df, attr):
@@ -59,6 +63,7 @@ def maskEmail(df, attr):
     :return: A DataFrame with the specified column masked.
     :rtype: pandas.DataFrame
     :raises TypeError: If any email is not None or a string.
+    :raises ValueError: If any email does not contain exactly one '@' or has an empty username.
 
     :example:
 
@@ -71,14 +76,16 @@ def maskEmail(df, attr):
     2                 None
     """
 
-    cont = []
-    for email in df[attr]:
-        if email is None:
-            cont.append(email)
-        elif not isinstance(email, str):
-            raise TypeError("Email must be a string.")
-        else:
-            name, domain = email.split("@")
-            cont.append(list(name)[0] + len(list(name)[1:]) * "*" + "@" + domain)
-    df[attr] = cont
-    return df
\ No newline at end of file
+    emails = df[attr]
+    _require_string(emails, message="Email must be a string.")
+    emails = emails.astype("string")
+    parts = emails.str.extract(r"(?s)^([^@]*)(@?)(.*)$")
+    name, sep, domain = parts[0], parts[1], parts[2]
+    if (sep[emails.notna()] != "@").any() or domain.str.contains("@", regex=False).any():
+        raise ValueError("Email must contain exactly one '@'.")
+    if (name[emails.notna()] == "").any():
+        raise ValueError("Email must have a username before '@'.")
+    masked = name.str[0] + _stars(name, 1) + "@" + domain
+    df_copy = _copy_frame(df)
+    df_copy[attr] = masked.astype(object).where(masked.notna(), None)
+    return df_copy
\ No newline at end of file
@@ -1,7 +1,25 @@
 import pandas as pd
 import numpy as np
 import random, string
-from datetime import timedelta
+from ._validate import _require_numeric, _require_datetime
+from ._frame import _copy_frame
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# columns at least this long use the numba kernel (when numba is installed)
+NUMBA_MIN_ROWS = 1_000_000
+
+# dtypes the numba kernel is compiled for (numba has no float16 support)
+_NUMBA_DTYPES = {np.dtype(t) for t in (np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64, np.float32, np.float64)}
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _floor_round(arr, base, out):
+        for i in prange(arr.shape[0]):
+            out[i] = (arr[i] // base) * base
 
 # base-3 rounding for age (in years)
 def agePerturbation(df, attr):
@@ -18,7 +36,7 @@ def agePerturbation(df, attr):
     :type attr: str
     :return: A DataFrame with the specified age column perturbed.
     :rtype: pandas.DataFrame
-    :raises TypeError: If any value in the age column is not numeric.
+    :raises TypeError: If the age column is not of a numeric dtype.
 
     :example:
 
@@ -33,15 +51,7 @@ def agePerturbation(df, attr):
     4   51
     """
 
-    cont = []
-    df_copy = df.copy()
-    for age in df_copy[attr]:
-        if not isinstance(age, (int, float, np.int8, np.int16, np.int32, np.int64, np.float32, np.float64)):
-            raise TypeError("Input must be a numerical data.")
-        else:
-            cont.append((age // 3) * 3)
-    df_copy[attr] = cont
-    return df_copy
+    return dataPerturbation(df, attr, 3)
 
 # base-3 rounding for weight (in kg)
 def weightPerturbation(df, attr):
@@ -58,7 +68,7 @@ def weightPerturbation(df, attr):
     :type attr: str
     :return: A DataFrame with the specified weight column perturbed.
     :rtype: pandas.DataFrame
-    :raises TypeError: If any value in the weight column is not numeric.
+    :raises TypeError: If the weight column is not of a numeric dtype.
 
     :example:
 
@@ -72,15 +82,7 @@ def weightPerturbation(df, attr):
     3      81
     """
 
-    cont = []
-    df_copy = df.copy()
-    for weight in df_copy[attr]:
-        if not isinstance(weight, (int, float, np.int8, np.int16, np.int32, np.int64, np.float32, np.float64)):
-            raise TypeError("Input must be a numerical data.")
-        else:
-            cont.append((weight // 3) * 3)
-    df_copy[attr] = cont
-    return df_copy  
+    return dataPerturbation(df, attr, 3)
 
 # base-5 rounding for height (in cm)
 def heightPerturbation(df, attr):
@@ -97,7 +99,7 @@ def heightPerturbation(df, attr):
     :type attr: str
     :return: A DataFrame with the specified height column perturbed.
     :rtype: pandas.DataFrame
-    :raises TypeError: If any value in the height column is not numeric.
+    :raises TypeError: If the height column is not of a numeric dtype.
 
     :example:
 
@@ -111,15 +113,7 @@ def heightPerturbation(df, attr):
     3     180
     """
 
-    cont = []
-    df_copy = df.copy()
-    for height in df_copy[attr]:
-        if not isinstance(height, (int, float, np.int8, np.int16, np.int32, np.int64, np.float32, np.float64)):
-            raise TypeError("Input must be a numerical data.")
-        else:
-            cont.append((height // 5) * 5)
-    df_copy[attr] = cont
-    return df_copy  
+    return dataPerturbation(df, attr, 5)
 
 # base-x roudning
 def dataPerturbation(df, attr, base_number):
@@ -138,7 +132,8 @@ def dataPerturbation(df, attr, base_number):
     :type base_number: int or float
     :return: A DataFrame with the specified column perturbed.
     :rtype: pandas.DataFrame
-    :raises TypeError: If any value in the specified column is not numeric.
+    :raises TypeError: If the specified column is not of a numeric dtype.
+    :raises ValueError: If base_number is zero.
 
     :example:
 
@@ -153,15 +148,19 @@ def dataPerturbation(df, attr, base_number):
     4     50
     """
 
-    cont = []
-    df_copy = df.copy()
-    for val in df_copy[attr]:
-        if not isinstance(val, (int, float, np.int8, np.int16, np.int32, np.int64, np.float32, np.float64)):
-            raise TypeError("Input must be a numerical data.")
-        else:
-            cont.append((val // base_number) * base_number)
-    df_copy[attr] = cont
-    return df_copy  
+    _require_numeric(df[attr])
+    if base_number == 0:
+        raise ValueError("Base number must not be zero.")
+    values = df[attr]
+    if njit is not None and len(values) >= NUMBA_MIN_ROWS and values.dtype in _NUMBA_DTYPES:
+        arr = values.to_numpy()
+        out = np.empty(arr.shape, dtype=np.result_type(arr, base_number))
+        _floor_round(arr, base_number, out)
+    else:
+        out = (values // base_number) * base_number
+    df_copy = _copy_frame(df)
+    df_copy[attr] = out
+    return df_copy
 
 # date shifting
 def datePerturbation(df, attr, max_days=30):
@@ -194,15 +193,11 @@ def datePerturbation(df, attr, max_days=30):
     Name: visit_date, dtype: datetime64[ns]
     """
 
-    if not pd.api.types.is_datetime64_any_dtype(df[attr]):
-        raise TypeError("Input must be in datetime format.")
-    cont = []
-    for date in df[attr]:
-        days_to_shift = np.random.randint(-max_days, max_days + 1)
-        shifted_date = date + timedelta(days = days_to_shift)
-        cont.append(shifted_date)
-    df[attr] = cont
-    return df
+    _require_datetime(df[attr])
+    days_to_shift = np.random.randint(-max_days, max_days + 1, size=len(df))
+    df_copy = _copy_frame(df)
+    df_copy[attr] = df[attr] + days_to_shift.astype("timedelta64[D]")
+    return df_copy
 
 
     
@@ -0,0 +1,49 @@
+import pandas as pd
+import numpy as np
+from ._frame import _copy_frame
+
+# chain column transforms
+def applyPipeline(df, steps):
+
+    """
+    Apply a sequence of column transforms to a DataFrame in a single pass.
+
+    Each step is a tuple of a transform function, the column it applies to and any further
+    positional arguments, e.g. ``(dataPerturbation, 'Score', 10)``. Every step runs on a
+    one-column frame holding the current values of its column, and all replaced columns are
+    written onto a single copy of the DataFrame at the end, instead of building a new
+    DataFrame per step. The copy is independent of the input; it is only shallow (sharing
+    the untouched columns until either frame is modified) when pandas' copy-on-write mode
+    is enabled. Steps must keep the rows unchanged (masking, perturbation and
+    generalization functions); use suppression, shuffling and pseudonymization separately.
+
+    :param df: The input DataFrame.
+    :type df: pandas.DataFrame
+    :param steps: List of (function, attribute, \\*args) tuples, applied in order.
+    :type steps: list of tuple
+    :return: A DataFrame with all steps applied.
+    :rtype: pandas.DataFrame
+
+    :example:
+
+    >>> import pandas as pd
+    >>> from df_anonymizer import maskID, agePerturbation, dataBucketing
+    >>> df = pd.DataFrame({'NRIC': ['S1234567A', 'T9876543B'], 'age': [22, 47]})
+    >>> applyPipeline(df, [
+    ...     (maskID, 'NRIC'),
+    ...     (agePerturbation, 'age'),
+    ...     (dataBucketing, 'age', [0, 30, 60], ['Young', 'Adult'])
+    ... ])
+            NRIC    age
+    0  ******67A  Young
+    1  ******43B  Adult
+    """
+
+    replacements = {}
+    for func, attr, *args in steps:
+        col = replacements.get(attr, df[attr])
+        replacements[attr] = func(col.to_frame(attr), attr, *args)[attr]
+    df_copy = _copy_frame(df)
+    for attr, col in replacements.items():
+        df_copy[attr] = col
+    return df_copy
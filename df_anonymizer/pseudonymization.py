@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
-import random, string
+import random, string, os
+from ._frame import _copy_frame
 
 # data pseudonymization
 def randomword():
@@ -29,7 +30,9 @@ def generatePseudonym(srs):
     Generate a list of pseudonym codes for unique values in a pandas Series.
 
     Each pseudonym consists of a random 5-letter lowercase string followed by a 
-    random 9-digit number, providing unique and anonymized identifiers.
+    random 9-digit number, providing unique and anonymized identifiers. The 9-digit
+    numbers are drawn without replacement, so the pseudonyms never collide. Seed both
+    ``random`` and ``numpy.random`` to reproduce the same pseudonyms.
 
     :param srs: A pandas Series containing values to be pseudonymized.
     :type srs: pandas.Series
@@ -44,55 +47,61 @@ def generatePseudonym(srs):
     ['abcde123456789', 'fghij987654321', 'klmno135792468']
     """
 
-    code_lst = []
-    srs_str = srs.astype(str)
-    total_unique = srs_str.nunique()
-    random_num = np.random.randint(low=100000000, high=999999999, size=total_unique)
-    random_char = [randomword() for i in range(total_unique)]
-    for m, n in zip(random_num, random_char):
-        code = n + str(m)
-        code_lst.append(code)
+    total_unique = srs.nunique(dropna=False)
+    random_num = np.array(random.sample(range(100000000, 999999999), total_unique))
+    letters = np.frombuffer(string.ascii_lowercase.encode(), dtype="S1")
+    random_char = np.random.choice(letters, size=(total_unique, 5)).view("S5").ravel().astype(str)
+    code_lst = np.char.add(random_char, random_num.astype(str)).tolist()
     return code_lst
 
 
-def pseudonymization(df, attr):
+def pseudonymization(df, attr, key_path=None):
 
     """
-    Replace values in a DataFrame column with unique pseudonyms and save the mapping key.
+    Replace values in a DataFrame column with unique pseudonyms and return the mapping key.
 
     This function generates unique pseudonyms for each distinct value in the specified column,
-    replaces the original values with these pseudonyms, and saves a key table mapping original 
-    values to pseudonyms in an Excel file named "key_table.xlsx".
+    replaces the original values with these pseudonyms, and returns the key table mapping
+    original values to pseudonyms. The key table is also saved to ``key_path`` when given,
+    as Parquet (".parquet"), Excel (".xlsx") or CSV (any other extension).
 
     :param df: The input DataFrame containing the attribute to pseudonymize.
     :type df: pandas.DataFrame
     :param attr: The name of the column to pseudonymize.
     :type attr: str
-    :return: A DataFrame with the specified column replaced by pseudonyms.
-    :rtype: pandas.DataFrame
+    :param key_path: Path of the file to save the key table to. If None, no file is written.
+    :type key_path: str, optional
+    :return: A DataFrame with the specified column replaced by pseudonyms, and the key table.
+    :rtype: tuple of (pandas.DataFrame, pandas.DataFrame)
 
     :example:
 
     >>> import pandas as pd
     >>> df = pd.DataFrame({'NRIC': ['S1234567A', 'T9876543B', 'S1234567A']})
-    >>> pseudonymized_df = pseudonymization(df, 'NRIC')
+    >>> pseudonymized_df, key_table = pseudonymization(df, 'NRIC', key_path="key_table.csv")
     >>> pseudonymized_df
           NRIC
     0  abcde123456789
     1  fghij987654321
     2  abcde123456789
+    >>> key_table
+            NRIC        PseudoID
+    0  S1234567A  abcde123456789
+    1  T9876543B  fghij987654321
     """
 
-    df_copy = df.copy()
-    while True:
-        pseduonyms = generatePseudonym(df_copy[attr])
-        if not pd.Series(pseduonyms).duplicated().any():
-            break
-    key = pd.Series(df[attr].unique()).sample(frac=1.0, replace=False, random_state=122, ignore_index=True)
-    key_table = pd.DataFrame([key, pd.Series(pseduonyms)]).T
-    key_table.columns = ["NRIC", "PseudoID"]
-    key_table.to_excel("key_table.xlsx", index=False)
-    mapping_dict = dict(zip(key_table["NRIC"], key_table["PseudoID"]))
-    cont = df_copy[attr].map(mapping_dict)
-    df_copy[attr] = cont
-    return df_copy
\ No newline at end of file
+    key = pd.unique(df[attr])
+    pseduonyms = generatePseudonym(pd.Series(key))
+    key_table = pd.DataFrame({"NRIC": key, "PseudoID": pseduonyms})
+    if key_path is not None:
+        ext = os.path.splitext(key_path)[1].lower()
+        if ext == ".parquet":
+            key_table.to_parquet(key_path, index=False)
+        elif ext == ".xlsx":
+            key_table.to_excel(key_path, index=False)
+        else:
+            key_table.to_csv(key_path, index=False)
+    mapping_dict = dict(zip(key, pseduonyms))
+    df_copy = _copy_frame(df)
+    df_copy[attr] = df[attr].map(mapping_dict)
+    return df_copy, key_table
\ No newline at end of file
@@ -26,4 +26,4 @@ def dataShuffling(df):
     2  3  z
     """
 
-    return df.sample(frac=1).reset_index(drop=True)
\ No newline at end of file
+    return df.take(np.random.permutation(len(df))).reset_index(drop=True)
\ No newline at end of file
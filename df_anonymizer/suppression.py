@@ -27,8 +27,7 @@ def attributeSuppression(df, attrs):
     1    Bob   30
     """
 
-    df_copy = df.copy()
-    return df_copy.drop(columns=attrs)
+    return df.drop(columns=attrs)
 
 # record (row) suppression - remove row
 def recordSuppression(df, attr_lst, attr_ex):
@@ -64,13 +63,13 @@ def recordSuppression(df, attr_lst, attr_ex):
     1   35   NY
     """
 
-    df_copy = df.copy()
-    if df_copy.empty:
+    if df.empty:
         raise ValueError("Dataframe is empty.")
     if len(attr_lst) != len(attr_ex):
         raise ValueError("Number of attribute(s) and list of the attribute conditions must be the same.")
+    keep = np.ones(len(df), dtype=bool)
     for attr, ex in zip(attr_lst, attr_ex):
-        if attr not in df_copy.columns:
+        if attr not in df.columns:
             raise ValueError(f"Attribute {attr} not found in the dataframe.")
-        df_copy = df_copy[~df_copy[attr].isin(ex)]
-    return df_copy.reset_index(drop=True)
\ No newline at end of file
+        keep &= ~df[attr].isin(ex).to_numpy()
+    return df.loc[keep].reset_index(drop=True)
\ No newline at end of file
@@ -11,4 +11,7 @@ setup(
         "pandas>=2.3.0,<3.0.0",
         "numpy>=2.0.2,<3.0.0"
     ],
+    extras_require={
+        "numba": ["numba>=0.60"]
+    },
 )
\ No newline at end of file